@@ -1,15 +1,23 @@
 import base64
 import logging
+import math
+import random
+import re
+import threading
 import time
 import requests
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
 
 from .mixins.ticket_mixin import TicketMixin
 from .mixins.configuration_mixin import ConfigurationMixin
 from .mixins.companies_mixin import CompaniesMixin
 from .mixins.boards_mixin import BoardsMixin
 from .mixins.lookup_mixin import LookupMixin
-from .utils import SecretString
+from .utils import SecretString, TTLCache, json_dumps, json_loads
 from .defaults import TicketDefaults
 from .exceptions import (
     ConnectWiseAPIError,
@@ -23,6 +31,72 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Static per-request headers for JSON write requests (POST/PUT/PATCH)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Transient server errors that are retried, and the methods safe to replay
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# Upper bound on a single computed backoff delay, in seconds
+_MAX_BACKOFF = 60
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+# Seconds a cached GET response is kept for If-None-Match revalidation once stale
+_RESPONSE_CACHE_TTL = 300
+# Splits a configured base URL into host, optional release segment and any API path
+_BASE_URL_RE = re.compile(r'^(?P<host>.*?)(?P<version>/v4_6_release)?(?:/apis/.*)?/*$')
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Seconds to wait from a response's Retry-After header, clamped to [0, _MAX_BACKOFF].
+
+    Returns None when the header is missing or not a number of seconds (e.g. an
+    HTTP-date), so callers fall back to their own backoff.
+    """
+    try:
+        value = float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(value):
+        return None
+    return max(0.0, min(value, _MAX_BACKOFF))
+
+
+def _decode_body(raw: bytes, empty: Any = None):
+    """Parse a response body exactly once; an empty body decodes to ``empty``."""
+    return json_loads(raw) if raw else empty
+
+
+class _CachedResponse(NamedTuple):
+    """A cached GET response body with its validator and freshness deadline."""
+    etag: Optional[str]
+    expires_at: float
+    content: bytes
+
+
+def _cache_entry(response: requests.Response) -> Optional[_CachedResponse]:
+    """
+    Build a cache entry from a GET response, or None if it should not be cached.
+
+    Only responses carrying an ETag or a Cache-Control max-age are cacheable.
+    Bodies are kept as raw bytes and parsed on every hit, so callers never
+    share (and can't mutate) cached objects.
+    """
+    cache_control = response.headers.get('Cache-Control', '')
+    if 'no-store' in cache_control:
+        return None
+    etag = response.headers.get('ETag')
+    max_age = _MAX_AGE_RE.search(cache_control)
+    if 'no-cache' in cache_control or not max_age:
+        expires_at = 0.0
+    else:
+        expires_at = time.monotonic() + int(max_age.group(1))
+    if etag is None and expires_at == 0.0:
+        return None
+    return _CachedResponse(etag, expires_at, response.content)
+
 
 class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsMixin, LookupMixin):
     """ConnectWise API Client with modular functionality via mixins."""
@@ -37,6 +111,9 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         ticket_defaults: Optional[TicketDefaults] = None,
         max_retries: int = 3,
         retry_backoff_base: int = 2,
+        max_concurrency: int = 10,
+        response_cache_size: int = 0,
+        pool_maxsize: int = 20,
     ):
         """
         Initialize ConnectWise client with credentials and optional defaults.
@@ -48,8 +125,15 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
             password: API password
             client_id: Client ID for API requests
             ticket_defaults: Optional TicketDefaults object for ticket creation defaults
-            max_retries: Number of retries on 429 rate limit responses (default: 3)
-            retry_backoff_base: Base for exponential backoff in seconds (default: 2 → 2s, 4s, 8s)
+            max_retries: Number of retries on 429, transient 5xx and connection errors (default: 3)
+            retry_backoff_base: Base for exponential backoff in seconds; each retry waits a
+                                jittered delay between base**n and base**(n+1) (default: 2)
+            max_concurrency: Maximum number of pages fetched in parallel by get_all (default: 10)
+            response_cache_size: Maximum GET responses kept for ETag/Cache-Control
+                                 revalidation; 0 disables the cache (default: 0).
+                                 Paginated page requests are never cached.
+            pool_maxsize: Keep-alive connections kept open to the ConnectWise host; raised
+                          to max_concurrency if smaller (default: 20)
         """
         # Validate required parameters
         if not base_url:
@@ -65,19 +149,22 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
 
         # Normalize base_url - strip trailing slashes and any API path
         # Support both old format (with /v4_6_release/apis/3.0) and new format (just domain)
-        self.base_url = base_url.rstrip('/')
-        if '/apis/' in self.base_url:
-            # Old format - extract just the base
-            self.base_url = self.base_url.split('/apis/')[0]
-        if self.base_url.endswith('/v4_6_release'):
+        match = _BASE_URL_RE.match(base_url)
+        host, version = match.group('host', 'version')
+        if version:
             # Already has version, keep it
+            self.base_url = host + version
             self.api_path = '/apis/3.0'
             self.service_path = '/services/system_io/Service'
         else:
             # Assume we need to add the version
+            self.base_url = host
             self.api_path = '/v4_6_release/apis/3.0'
             self.service_path = '/v4_6_release/services/system_io/Service'
 
+        # Full API base URL, built once rather than on every request
+        self._api_base = f"{self.base_url}{self.api_path}"
+
         self.client = client
         self.username = username
         self.client_id = client_id
@@ -88,12 +175,63 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         # Store ticket defaults
         self.ticket_defaults = ticket_defaults or TicketDefaults()
 
+        # Per-type configuration question definitions (see get_configuration_type_questions)
+        self._question_cache = TTLCache(maxsize=256, ttl=self._QUESTION_CACHE_TTL)
+
+        # Per-company configuration lists (see get_company_configurations)
+        self._company_config_cache = TTLCache(maxsize=128, ttl=self._COMPANY_CONFIG_CACHE_TTL)
+
+        # Recently fetched tickets (see get_ticket)
+        self._ticket_cache = TTLCache(maxsize=4096, ttl=self._TICKET_CACHE_TTL)
+
         # Retry configuration
         self.max_retries = max_retries
         self.retry_backoff_base = retry_backoff_base
 
-        # Build the auth header
+        # Concurrency for paginated and batched fetches
+        self.max_concurrency = max_concurrency
+        # Marks _map_concurrent worker threads, whose own fetches run sequentially
+        self._worker_state = threading.local()
+
+        # Conditional-GET cache for responses that carry ETag / max-age headers
+        self._response_cache = (
+            TTLCache(maxsize=response_cache_size, ttl=_RESPONSE_CACHE_TTL)
+            if response_cache_size > 0 else None
+        )
+
+        # Build the auth header and the static headers sent with every request
         self._auth_token = self._get_auth()
+        self._base_headers = {
+            "Authorization": self._auth_token,
+            "clientId": self.client_id
+        }
+
+        # Shared session so every request reuses pooled keep-alive connections
+        # instead of paying a fresh TCP/TLS handshake. Retries are handled by
+        # the HTTP methods below, so the adapter itself never retries. The pool
+        # holds at least max_concurrency connections so concurrent fetches never
+        # have connections discarded and re-opened.
+        self._session = requests.Session()
+        self._session.headers.update(self._base_headers)
+        adapter = HTTPAdapter(pool_connections=10,
+                              pool_maxsize=max(pool_maxsize, max_concurrency),
+                              max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    # ========================================================================
+    # SESSION LIFECYCLE
+    # ========================================================================
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> 'ConnectWiseClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
     
     # ========================================================================
     # AUTHENTICATION
@@ -111,7 +249,7 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
     
     def get_api_url(self) -> str:
         """Get the full API base URL."""
-        return f"{self.base_url}{self.api_path}"
+        return self._api_base
     
     def get_ticket_url(self, ticket_id: int) -> str:
         """
@@ -125,6 +263,45 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         """
         return f"{self.base_url}{self.service_path}/fv_sr100_request.rails?service_recid={ticket_id}"
     
+    # ========================================================================
+    # CONCURRENCY HELPERS
+    # ========================================================================
+
+    def _map_concurrent(self, func: Callable, items: Iterable) -> list:
+        """
+        Apply func to each item concurrently over the shared session.
+
+        Args:
+            func: Callable taking a single item (typically one API call)
+            items: Items to process
+
+        Returns:
+            list: Results in the same order as items
+
+        Raises:
+            ConnectWiseAPIError: The first error raised by any call
+        """
+        items = list(items)
+        if len(items) <= 1 or self.max_concurrency <= 1 or self._in_worker():
+            return [func(item) for item in items]
+
+        def run(item):
+            # Nested paging/mapping inside func stays sequential, so at most
+            # max_concurrency requests are in flight (and pool_maxsize holds)
+            self._worker_state.active = True
+            try:
+                return func(item)
+            finally:
+                self._worker_state.active = False
+
+        workers = min(self.max_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, items))
+
+    def _in_worker(self) -> bool:
+        """Whether the current thread is running an item for _map_concurrent."""
+        return bool(getattr(self._worker_state, 'active', False))
+
     # ========================================================================
     # ERROR HANDLING
     # ========================================================================
@@ -144,10 +321,12 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
             ConnectWiseServerError: For 5xx responses
             ConnectWiseAPIError: For other error responses
         """
+        error_data = None
         try:
-            error_data = response.json()
+            error_data = json_loads(response.content)
             error_message = error_data.get('message', str(error_data))
-        except:
+        except (ValueError, AttributeError):
+            # Body was empty or not JSON (ValueError) or not a JSON object (AttributeError)
             error_message = response.text or f"HTTP {response.status_code} error"
 
         status_code = response.status_code
@@ -156,41 +335,134 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
             raise ConnectWiseNotFoundError(
                 error_message,
                 status_code=status_code,
-                response_data=error_data if 'error_data' in locals() else None
+                response_data=error_data
             )
         elif status_code == 401:
             raise ConnectWiseAuthenticationError(
                 error_message,
                 status_code=status_code,
-                response_data=error_data if 'error_data' in locals() else None
+                response_data=error_data
             )
         elif status_code == 400:
             raise ConnectWiseBadRequestError(
                 error_message,
                 status_code=status_code,
-                response_data=error_data if 'error_data' in locals() else None
+                response_data=error_data
             )
         elif status_code == 429:
-            retry_after = response.headers.get('Retry-After')
+            retry_after = _retry_after(response)
             raise ConnectWiseRateLimitError(
                 error_message,
                 status_code=status_code,
-                retry_after=int(retry_after) if retry_after else None,
-                response_data=error_data if 'error_data' in locals() else None
+                retry_after=math.ceil(retry_after) if retry_after is not None else None,
+                response_data=error_data
             )
         elif status_code >= 500:
             raise ConnectWiseServerError(
                 error_message,
                 status_code=status_code,
-                response_data=error_data if 'error_data' in locals() else None
+                response_data=error_data
             )
         else:
             raise ConnectWiseAPIError(
                 error_message,
                 status_code=status_code,
-                response_data=error_data if 'error_data' in locals() else None
+                response_data=error_data
             )
 
+    # ========================================================================
+    # RETRIES
+    # ========================================================================
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with jitter for the given (zero-based) attempt.
+
+        Returns a random delay between retry_backoff_base ** attempt and
+        retry_backoff_base ** (attempt + 1) seconds, capped at _MAX_BACKOFF, so
+        concurrent callers hitting the same limit don't retry in lockstep.
+        """
+        low = self.retry_backoff_base ** attempt
+        high = self.retry_backoff_base ** (attempt + 1)
+        return min(random.uniform(low, high), _MAX_BACKOFF)
+
+    def _request(self, method: str, url: str, label: str, **kwargs) -> requests.Response:
+        """
+        Send a request on the shared session, retrying transient failures.
+
+        Connection errors and 429 responses are retried for every method
+        (honoring a Retry-After given in seconds, capped at _MAX_BACKOFF);
+        502/503/504 responses are retried for idempotent methods only, so a POST
+        is never replayed after the server may have processed it. At most
+        max_retries retries are made.
+
+        Args:
+            method: HTTP method (e.g., "GET")
+            url: Full request URL
+            label: Short description of the target used in log messages
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            requests.Response: The final response, which may still be an error
+
+        Raises:
+            ConnectWiseAPIError: If the connection fails on every attempt
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt < self.max_retries:
+                    wait = self._backoff_delay(attempt)
+                    logger.warning(f"Connection error on {method} {label}, retrying in {wait:.1f}s (attempt {attempt + 1}/{self.max_retries}): {e}")
+                    time.sleep(wait)
+                    continue
+                raise ConnectWiseAPIError(f"Connection failed for {label}: {e}")
+
+            if attempt < self.max_retries:
+                if response.status_code == 429:
+                    wait = _retry_after(response)
+                    if wait is None:
+                        wait = self._backoff_delay(attempt)
+                    logger.warning(f"Rate limited on {method} {label}, retrying in {wait:.1f}s (attempt {attempt + 1}/{self.max_retries})")
+                    time.sleep(wait)
+                    continue
+
+                if response.status_code in _RETRY_STATUSES and method in _IDEMPOTENT_METHODS:
+                    wait = self._backoff_delay(attempt)
+                    logger.warning(f"Server error {response.status_code} on {method} {label}, retrying in {wait:.1f}s (attempt {attempt + 1}/{self.max_retries})")
+                    time.sleep(wait)
+                    continue
+
+            return response
+
+    # ========================================================================
+    # RESPONSE CACHE
+    # ========================================================================
+
+    def _invalidate_cache(self, endpoint: str, record_id: Optional[int] = None) -> None:
+        """
+        Drop cached data for an endpoint that has just been written.
+
+        Clears cached GET responses under the endpoint and, for writes under
+        service/tickets/{id}, the cached copy of that ticket.
+        """
+        if self._response_cache is not None:
+            url_prefix = f"{self._api_base}/{endpoint}"
+            self._response_cache.remove_if(lambda key: key[0].startswith(url_prefix))
+        path = endpoint if record_id is None else f"{endpoint}/{record_id}"
+        parts = path.split("/", 3)
+        if len(parts) > 2 and parts[0] == "service" and parts[1] == "tickets" and parts[2].isdigit():
+            self._ticket_cache.pop(int(parts[2]))
+
+    def clear_cache(self) -> None:
+        """Discard all cached GET responses and cached lookups."""
+        if self._response_cache is not None:
+            self._response_cache.clear()
+        self._question_cache.clear()
+        self._company_config_cache.clear()
+        self._ticket_cache.clear()
+
     # ========================================================================
     # BASE HTTP METHODS
     # ========================================================================
@@ -203,18 +475,25 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         This method handles single requests without pagination.
 
         Returns:
-            dict: Response data, or None if resource not found (404)
+            dict: Response data, or None if resource not found (404) or the body is empty
 
         Raises:
             ConnectWiseAPIError: For API errors (except 404)
         """
-        url = f"{self.get_api_url()}/{endpoint}"
-        headers = {
-            "Authorization": self._auth_token,
-            "clientId": self.client_id
-        }
+        params = self._build_params(
+            conditions=conditions,
+            childconditions=childconditions,
+            fields=fields,
+            pagesize=pagesize,
+            orderby=orderby,
+            page=page
+        )
+        return self._get(endpoint, params)
 
-        # Build query params
+    @staticmethod
+    def _build_params(conditions: str = "", childconditions: str = "", fields: str = "",
+                      pagesize: int = None, orderby: str = "", page: int = None) -> dict:
+        """Build a GET query-params dict, omitting empty values."""
         params = {}
         if conditions:
             params["conditions"] = conditions
@@ -228,34 +507,54 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
             params["orderby"] = orderby
         if page:
             params["page"] = page
+        return params
 
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = requests.get(url, headers=headers, params=params)
-            except (requests.ConnectionError, requests.Timeout) as e:
-                if attempt < self.max_retries:
-                    wait = self.retry_backoff_base ** attempt
-                    logger.warning(f"Connection error on GET {endpoint}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries}): {e}")
-                    time.sleep(wait)
-                    continue
-                raise ConnectWiseAPIError(f"Connection failed for {endpoint}: {e}")
+    def _get(self, endpoint: str, params: dict) -> Optional[dict]:
+        """
+        Perform a single GET request with prebuilt query params.
 
-            # Handle 404s by returning None (expected case for missing resources)
-            if response.status_code == 404:
-                return None
+        Returns:
+            dict: Response data, or None if resource not found (404) or the body is empty
 
-            if response.status_code == 429 and attempt < self.max_retries:
-                retry_after = response.headers.get('Retry-After')
-                wait = int(retry_after) if retry_after else self.retry_backoff_base ** attempt
-                logger.warning(f"Rate limited on GET {endpoint}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries})")
-                time.sleep(wait)
-                continue
+        Raises:
+            ConnectWiseAPIError: For API errors (except 404)
+        """
+        url = f"{self._api_base}/{endpoint}"
 
-            # Handle other errors
-            if not response.ok:
-                self._handle_response_error(response)
+        # Pages of list endpoints are not cached: they are large and rarely re-read
+        cache = self._response_cache if "page" not in params else None
+        if cache is None:
+            response = self._request("GET", url, endpoint, params=params)
+        else:
+            # Serve fresh entries locally; revalidate stale ones with If-None-Match
+            cache_key = (url, tuple(sorted(params.items())))
+            cached = cache.get(cache_key)
+            if cached is not None and cached.expires_at > time.monotonic():
+                return _decode_body(cached.content)
+            headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else None
+            response = self._request("GET", url, endpoint, params=params, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                # Not modified: keep the body and extend its freshness if max-age was sent
+                max_age = _MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+                if max_age:
+                    cache.set(cache_key, cached._replace(
+                        expires_at=time.monotonic() + int(max_age.group(1))
+                    ))
+                return _decode_body(cached.content)
+
+        # Handle 404s by returning None (expected case for missing resources)
+        if response.status_code == 404:
+            return None
 
-            return response.json()
+        # Handle other errors
+        if not response.ok:
+            self._handle_response_error(response)
+
+        if cache is not None:
+            entry = _cache_entry(response)
+            if entry is not None:
+                cache.set(cache_key, entry)
+        return _decode_body(response.content)
     
     def get_count(self, endpoint: str, conditions: str = "",
                   childconditions: str = "") -> Optional[int]:
@@ -273,11 +572,8 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         Raises:
             ConnectWiseAPIError: For API errors
         """
-        result = self.get(
-            f"{endpoint}/count",
-            conditions=conditions if conditions else None,
-            childconditions=childconditions if childconditions else None
-        )
+        params = self._build_params(conditions=conditions, childconditions=childconditions)
+        result = self._get(f"{endpoint}/count", params)
         if result is None:
             return None
         try:
@@ -291,44 +587,115 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         Perform paginated GET requests to retrieve all records from the ConnectWise API.
         This method automatically handles pagination and returns all results as a list.
 
+        Page 1 is requested first; if it comes back short, that is the whole result
+        and no further requests are made. Otherwise the total is read from the
+        endpoint's /count and the remaining pages are requested concurrently (up to
+        max_concurrency at a time). Endpoints without /count fall back to batches
+        that double in size until a short page marks the end of the data.
+
         Returns:
             list: All records from the endpoint
 
         Raises:
             ConnectWiseAPIError: For API errors
         """
-        count = self.get_count(endpoint, conditions=conditions, childconditions=childconditions)
-        if count is None:
-            return []
+        responses = []
+        # Extend by whole pages: one list resize per page rather than per record
+        for page in self._iter_pages(endpoint, conditions, childconditions,
+                                     fields, pagesize, orderby):
+            responses.extend(page)
+        return responses
 
+    def iter_all(self, endpoint: str, conditions: str = "", childconditions: str = "",
+                 fields: str = "", pagesize: int = None, orderby: str = "") -> Iterator[dict]:
+        """
+        Lazily iterate over all records from a paginated endpoint.
+
+        Uses the same pagination strategy as get_all, but yields records page by
+        page as they arrive, so callers that process records one at a time never
+        hold the complete result list in memory.
+
+        Yields:
+            dict: Each record, in page order
+
+        Raises:
+            ConnectWiseAPIError: For API errors
+        """
+        for page in self._iter_pages(endpoint, conditions, childconditions,
+                                     fields, pagesize, orderby):
+            yield from page
+
+    def _iter_pages(self, endpoint: str, conditions: str, childconditions: str,
+                    fields: str, pagesize: Optional[int], orderby: str) -> Iterator[list]:
+        """
+        Yield each page of results as a list, in page order (see get_all).
+        """
         if pagesize is None:
             pagesize = 1000
 
-        responses = []
-        total_pages = (count + pagesize - 1) // pagesize
-
-        for page in range(1, total_pages + 1):
-            result = self.get(
-                endpoint,
-                conditions=conditions,
-                childconditions=childconditions,
-                fields=fields,
-                pagesize=pagesize,
-                page=page,
-                orderby=orderby
-            )
-
-            # If a page returns None, stop pagination
-            if result is None:
-                break
+        # Everything but the page number is the same for every request
+        base_params = self._build_params(
+            conditions=conditions,
+            childconditions=childconditions,
+            fields=fields,
+            pagesize=pagesize,
+            orderby=orderby
+        )
 
-            if isinstance(result, list):
-                responses.extend(result)
-            else:
-                # Single result, wrap in list
-                responses.append(result)
+        def fetch_page(page: int):
+            return self._get(endpoint, {**base_params, "page": page})
+
+        def drain(results):
+            """Yield pages from results in order; return True once the data ends."""
+            for result in results:
+                # A missing, empty or short page is the end of the data
+                if not result:
+                    return True
+                if not isinstance(result, list):
+                    # Single result, wrap in list
+                    yield [result]
+                    return True
+                yield result
+                if len(result) < pagesize:
+                    return True
+            return False
+
+        # Speculatively fetch page 1: most result sets fit in a single page,
+        # which then costs one request and no /count call at all
+        first = fetch_page(1)
+        if (yield from drain([first])):
+            return
 
-        return responses
+        count = self.get_count(endpoint, conditions=conditions, childconditions=childconditions)
+        # Inside a _map_concurrent worker, page one request at a time
+        max_batch = 1 if self._in_worker() else max(self.max_concurrency, 1)
+        with ThreadPoolExecutor(max_workers=max_batch) as executor:
+
+            def fetch_window(pages):
+                """Fetch pages in order, keeping at most max_batch in flight or unconsumed."""
+                pages = iter(pages)
+                pending = deque(executor.submit(fetch_page, page) for page in islice(pages, max_batch))
+                while pending:
+                    result = pending.popleft().result()
+                    page = next(pages, None)
+                    if page is not None:
+                        pending.append(executor.submit(fetch_page, page))
+                    yield result
+
+            if count is not None:
+                # Total known: stream the remaining pages through a sliding window, so
+                # a slow consumer holds at most max_batch pages rather than all of them
+                total_pages = (count + pagesize - 1) // pagesize
+                yield from drain(fetch_window(range(2, total_pages + 1)))
+                return
+
+            # No count available: request growing batches until a short page
+            # (executor.map preserves page order)
+            next_page = 2
+            batch_size = min(2, max_batch)
+            while not (yield from drain(executor.map(fetch_page, range(next_page, next_page + batch_size)))):
+                next_page += batch_size
+                batch_size = min(batch_size * 2, max_batch)
     
     def patch(self, endpoint: str, record_id: int, operations: list) -> Optional[dict]:
         """
@@ -348,40 +715,20 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         Raises:
             ConnectWiseAPIError: For API errors (except 404)
         """
-        url = f"{self.get_api_url()}/{endpoint}/{record_id}"
-        headers = {
-            "Authorization": self._auth_token,
-            "clientId": self.client_id,
-            "Content-Type": "application/json"
-        }
+        url = f"{self._api_base}/{endpoint}/{record_id}"
+        response = self._request("PATCH", url, f"{endpoint}/{record_id}",
+                                 headers=_JSON_HEADERS, data=json_dumps(operations))
+        self._invalidate_cache(endpoint, record_id)
 
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = requests.patch(url, headers=headers, json=operations)
-            except (requests.ConnectionError, requests.Timeout) as e:
-                if attempt < self.max_retries:
-                    wait = self.retry_backoff_base ** attempt
-                    logger.warning(f"Connection error on PATCH {endpoint}/{record_id}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries}): {e}")
-                    time.sleep(wait)
-                    continue
-                raise ConnectWiseAPIError(f"Connection failed for {endpoint}/{record_id}: {e}")
-
-            # Handle 404s by returning None
-            if response.status_code == 404:
-                return None
-
-            if response.status_code == 429 and attempt < self.max_retries:
-                retry_after = response.headers.get('Retry-After')
-                wait = int(retry_after) if retry_after else self.retry_backoff_base ** attempt
-                logger.warning(f"Rate limited on PATCH {endpoint}/{record_id}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries})")
-                time.sleep(wait)
-                continue
+        # Handle 404s by returning None
+        if response.status_code == 404:
+            return None
 
-            # Handle other errors
-            if not response.ok:
-                self._handle_response_error(response)
+        # Handle other errors
+        if not response.ok:
+            self._handle_response_error(response)
 
-            return response.json()
+        return _decode_body(response.content, {})
     
     def post(self, endpoint: str, data: dict) -> dict:
         """
@@ -397,36 +744,15 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         Raises:
             ConnectWiseAPIError: For API errors
         """
-        url = f"{self.get_api_url()}/{endpoint}"
-        headers = {
-            "Authorization": self._auth_token,
-            "clientId": self.client_id,
-            "Content-Type": "application/json"
-        }
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = requests.post(url, headers=headers, json=data)
-            except (requests.ConnectionError, requests.Timeout) as e:
-                if attempt < self.max_retries:
-                    wait = self.retry_backoff_base ** attempt
-                    logger.warning(f"Connection error on POST {endpoint}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries}): {e}")
-                    time.sleep(wait)
-                    continue
-                raise ConnectWiseAPIError(f"Connection failed for {endpoint}: {e}")
+        url = f"{self._api_base}/{endpoint}"
+        response = self._request("POST", url, endpoint, headers=_JSON_HEADERS, data=json_dumps(data))
+        self._invalidate_cache(endpoint)
 
-            if response.status_code == 429 and attempt < self.max_retries:
-                retry_after = response.headers.get('Retry-After')
-                wait = int(retry_after) if retry_after else self.retry_backoff_base ** attempt
-                logger.warning(f"Rate limited on POST {endpoint}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries})")
-                time.sleep(wait)
-                continue
+        # Handle errors
+        if not response.ok:
+            self._handle_response_error(response)
 
-            # Handle errors
-            if not response.ok:
-                self._handle_response_error(response)
-
-            return response.json()
+        return _decode_body(response.content, {})
 
     def put(self, endpoint: str, record_id: int, data: dict) -> Optional[dict]:
         """
@@ -443,40 +769,20 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         Raises:
             ConnectWiseAPIError: For API errors (except 404)
         """
-        url = f"{self.get_api_url()}/{endpoint}/{record_id}"
-        headers = {
-            "Authorization": self._auth_token,
-            "clientId": self.client_id,
-            "Content-Type": "application/json"
-        }
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = requests.put(url, headers=headers, json=data)
-            except (requests.ConnectionError, requests.Timeout) as e:
-                if attempt < self.max_retries:
-                    wait = self.retry_backoff_base ** attempt
-                    logger.warning(f"Connection error on PUT {endpoint}/{record_id}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries}): {e}")
-                    time.sleep(wait)
-                    continue
-                raise ConnectWiseAPIError(f"Connection failed for {endpoint}/{record_id}: {e}")
-
-            # Handle 404s by returning None
-            if response.status_code == 404:
-                return None
+        url = f"{self._api_base}/{endpoint}/{record_id}"
+        response = self._request("PUT", url, f"{endpoint}/{record_id}",
+                                 headers=_JSON_HEADERS, data=json_dumps(data))
+        self._invalidate_cache(endpoint, record_id)
 
-            if response.status_code == 429 and attempt < self.max_retries:
-                retry_after = response.headers.get('Retry-After')
-                wait = int(retry_after) if retry_after else self.retry_backoff_base ** attempt
-                logger.warning(f"Rate limited on PUT {endpoint}/{record_id}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries})")
-                time.sleep(wait)
-                continue
+        # Handle 404s by returning None
+        if response.status_code == 404:
+            return None
 
-            # Handle other errors
-            if not response.ok:
-                self._handle_response_error(response)
+        # Handle other errors
+        if not response.ok:
+            self._handle_response_error(response)
 
-            return response.json()
+        return _decode_body(response.content, {})
 
     def delete(self, endpoint: str, record_id: int) -> bool:
         """
@@ -492,29 +798,17 @@ class ConnectWiseClient(TicketMixin, ConfigurationMixin, CompaniesMixin, BoardsM
         Raises:
             ConnectWiseAPIError: For API errors (except 404)
         """
-        url = f"{self.get_api_url()}/{endpoint}/{record_id}"
-        headers = {
-            "Authorization": self._auth_token,
-            "clientId": self.client_id
-        }
-
-        for attempt in range(self.max_retries + 1):
-            response = requests.delete(url, headers=headers)
-
-            # Handle 404s by returning False
-            if response.status_code == 404:
-                return False
+        url = f"{self._api_base}/{endpoint}/{record_id}"
+        response = self._request("DELETE", url, f"{endpoint}/{record_id}")
+        self._invalidate_cache(endpoint, record_id)
 
-            if response.status_code == 429 and attempt < self.max_retries:
-                retry_after = response.headers.get('Retry-After')
-                wait = int(retry_after) if retry_after else self.retry_backoff_base ** attempt
-                logger.warning(f"Rate limited on DELETE {endpoint}/{record_id}, retrying in {wait}s (attempt {attempt + 1}/{self.max_retries})")
-                time.sleep(wait)
-                continue
+        # Handle 404s by returning False
+        if response.status_code == 404:
+            return False
 
-            # Handle other errors
-            if not response.ok:
-                self._handle_response_error(response)
+        # Handle other errors
+        if not response.ok:
+            self._handle_response_error(response)
 
-            # DELETE typically returns 204 No Content on success
-            return response.status_code == 204 or response.ok
\ No newline at end of file
+        # DELETE typically returns 204 No Content on success
+        return response.status_code == 204 or response.ok
\ No newline at end of file
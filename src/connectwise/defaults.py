@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from .utils import add_slots
 
+
+@add_slots
 @dataclass
 class TicketDefaults:
     """
@@ -39,12 +42,10 @@ class TicketDefaults:
     type_id: Optional[int] = None
     source_id: Optional[int] = None
 
+    # Field names in display order (class constant, not a dataclass field)
+    _FIELDS = ('company_id', 'board_id', 'priority_id', 'status_id', 'type_id', 'source_id')
+
     def __repr__(self) -> str:
         """Custom repr to show only non-None values."""
-        fields = []
-        for field_name in ['company_id', 'board_id', 'priority_id', 'status_id', 'type_id', 'source_id']:
-            value = getattr(self, field_name)
-            if value is not None:
-                fields.append(f"{field_name}={value}")
-
-        return f"TicketDefaults({', '.join(fields)})"
+        pairs = [f"{name}={value}" for name in self._FIELDS if (value := getattr(self, name)) is not None]
+        return f"TicketDefaults({', '.join(pairs)})"
@@ -1,10 +1,17 @@
-from typing import List, Optional
+import copy
+from typing import Dict, Iterator, List, Optional
 
 from ..models import Configuration
 
+_OP_REPLACE = "replace"
+
 
 class ConfigurationMixin:
     """Configuration-related API methods."""
+
+    # Question definitions are per-type metadata that rarely changes
+    _QUESTION_CACHE_TTL = 3600
+    _COMPANY_CONFIG_CACHE_TTL = 60
     
     def attach_configuration(self, ticket_id: int, config_id: int) -> Configuration:
         """
@@ -33,6 +40,41 @@ class ConfigurationMixin:
             bool: True if successfully detached, False if not found
         """
         return self.delete(f"service/tickets/{ticket_id}/configurations", config_id)
+
+    def attach_configurations(self, ticket_id: int, config_ids: List[int]) -> List[Configuration]:
+        """
+        Attach several configurations to a ticket.
+
+        ConnectWise has no bulk endpoint for this, so the individual requests
+        are issued concurrently over the shared session.
+
+        Args:
+            ticket_id: Ticket ID to attach configurations to
+            config_ids: Configuration IDs to attach
+
+        Returns:
+            List[Configuration]: The attached configurations, in the order given
+        """
+        return self._map_concurrent(
+            lambda config_id: self.attach_configuration(ticket_id, config_id),
+            config_ids
+        )
+
+    def detach_configurations(self, ticket_id: int, config_ids: List[int]) -> List[bool]:
+        """
+        Detach several configurations from a ticket concurrently.
+
+        Args:
+            ticket_id: Ticket ID
+            config_ids: Configuration IDs to detach
+
+        Returns:
+            List[bool]: Per-configuration result (False if not found), in the order given
+        """
+        return self._map_concurrent(
+            lambda config_id: self.detach_configuration(ticket_id, config_id),
+            config_ids
+        )
     
     def get_ticket_configurations(self, ticket_id: int) -> List[Configuration]:
         """
@@ -44,8 +86,20 @@ class ConfigurationMixin:
         Returns:
             List[Configuration]: List of attached configurations
         """
-        results = self.get_all(f"service/tickets/{ticket_id}/configurations")
-        return [Configuration.from_dict(config) for config in results]
+        return list(self.iter_ticket_configurations(ticket_id))
+
+    def iter_ticket_configurations(self, ticket_id: int) -> Iterator[Configuration]:
+        """
+        Lazily iterate over the configurations attached to a ticket.
+
+        Args:
+            ticket_id: Ticket ID
+
+        Yields:
+            Configuration: Each attached configuration
+        """
+        results = self.iter_all(f"service/tickets/{ticket_id}/configurations")
+        return (Configuration.from_dict(config) for config in results)
     
     def get_configuration_count(self, conditions: str = "") -> Optional[int]:
         """
@@ -76,7 +130,8 @@ class ConfigurationMixin:
     def get_configurations(
         self,
         conditions: str = "",
-        pagesize: int = 1000
+        pagesize: int = 1000,
+        fields: str = ""
     ) -> List[Configuration]:
         """
         Get multiple configurations with optional filtering.
@@ -84,19 +139,51 @@ class ConfigurationMixin:
         Args:
             conditions: ConnectWise conditions string for filtering
             pagesize: Results per page
+            fields: Optional comma-separated fields to include in the response,
+                    e.g. Configuration.LIST_FIELDS; omitted fields keep their defaults
 
         Returns:
             List[Configuration]: List of configurations
         """
-        results = self.get_all("company/configurations",
-                              conditions=conditions,
-                              pagesize=pagesize)
-        return [Configuration.from_dict(config) for config in results]
+        return list(self.iter_configurations(conditions=conditions, pagesize=pagesize,
+                                             fields=fields))
+
+    def iter_configurations(
+        self,
+        conditions: str = "",
+        pagesize: int = 1000,
+        fields: str = ""
+    ) -> Iterator[Configuration]:
+        """
+        Lazily iterate over configurations with optional filtering.
+
+        Pages are fetched as the iterator is consumed, so large result sets can
+        be filtered or processed without holding every configuration in memory.
+
+        Args:
+            conditions: ConnectWise conditions string for filtering
+            pagesize: Results per page
+            fields: Optional comma-separated fields to include in the response
+
+        Yields:
+            Configuration: Each matching configuration
+        """
+        results = self.iter_all("company/configurations",
+                                conditions=conditions,
+                                fields=fields,
+                                pagesize=pagesize)
+        return (Configuration.from_dict(config) for config in results)
     
     def get_company_configurations(self, company_id: int) -> List[Configuration]:
         """
         Get all configurations for a specific company.
 
+        Configurations are cached per company for _COMPANY_CONFIG_CACHE_TTL seconds;
+        each call returns its own copy, so callers may modify the result freely.
+        Repeated lookups (e.g. while enriching a batch of tickets) skip both the
+        count and page requests. Creating, updating or deleting a configuration
+        through this client clears the cache.
+
         Args:
             company_id: Company ID
 
@@ -104,12 +191,19 @@ class ConfigurationMixin:
             List[Configuration]: List of configurations for the company
         """
         conditions = f"company/id={company_id}"
-        return self.get_configurations(conditions=conditions)
+        configs = self._company_config_cache.get(conditions)
+        if configs is None:
+            configs = self.get_configurations(conditions=conditions)
+            self._company_config_cache.set(conditions, configs)
+        return copy.deepcopy(configs)
 
     def get_configuration_type_questions(self, type_id: int) -> List[dict]:
         """
         Get the custom question definitions for a configuration type.
 
+        Definitions are cached per type for _QUESTION_CACHE_TTL seconds; each call
+        returns its own copy, so callers may modify the result freely.
+
         Args:
             type_id: The configuration type ID.
 
@@ -117,8 +211,11 @@ class ConfigurationMixin:
             List[dict]: List of question definitions, each containing
                         'questionId', 'question' (label), 'fieldType', etc.
         """
-        results = self.get_all(f"company/configurations/types/{type_id}/questions")
-        return results
+        results = self._question_cache.get(type_id)
+        if results is None:
+            results = self.get_all(f"company/configurations/types/{type_id}/questions")
+            self._question_cache.set(type_id, results)
+        return copy.deepcopy(results)
 
     def create_configuration(self, config: Configuration) -> Configuration:
         """
@@ -133,6 +230,7 @@ class ConfigurationMixin:
         """
         data = config.to_dict(exclude_id=True)
         result = self.post("company/configurations", data=data)
+        self._company_config_cache.clear()
         return Configuration.from_dict(result)
 
     def update_configuration(self, config_id: int, config: Configuration) -> Configuration:
@@ -151,12 +249,29 @@ class ConfigurationMixin:
         """
         data = config.to_dict(exclude_id=True)
         operations = [
-            {"op": "replace", "path": field, "value": value}
+            {"op": _OP_REPLACE, "path": field, "value": value}
             for field, value in data.items()
         ]
         result = self.patch("company/configurations", config_id, operations)
+        self._company_config_cache.clear()
         return Configuration.from_dict(result)
 
+    def update_configurations(self, updates: Dict[int, Configuration]) -> List[Configuration]:
+        """
+        Update several configuration items concurrently.
+
+        Args:
+            updates: Mapping of configuration ID to the Configuration holding
+                     the fields to update (see update_configuration).
+
+        Returns:
+            List[Configuration]: The updated configurations, in the mapping's order.
+        """
+        return self._map_concurrent(
+            lambda item: self.update_configuration(*item),
+            updates.items()
+        )
+
     def delete_configuration(self, config_id: int) -> bool:
         """
         Delete a configuration item.
@@ -167,4 +282,6 @@ class ConfigurationMixin:
         Returns:
             bool: True if deleted, False if not found.
         """
-        return self.delete("company/configurations", config_id)
\ No newline at end of file
+        deleted = self.delete("company/configurations", config_id)
+        self._company_config_cache.clear()
+        return deleted
\ No newline at end of file
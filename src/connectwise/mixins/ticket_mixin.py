@@ -1,10 +1,16 @@
-from typing import List, Optional
+from dataclasses import replace
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..models import Ticket, Note
 
+# IDs per "id in (...)" query, keeping request URLs well under server limits
+_ID_BATCH_SIZE = 200
+
 
 class TicketMixin:
     """Ticket-related API methods."""
+
+    _TICKET_CACHE_TTL = 30
     
     def create_ticket(
         self,
@@ -39,23 +45,25 @@ class TicketMixin:
             config_ids = []
 
         # Use ticket defaults if not provided
-        company_id = company_id or self.ticket_defaults.company_id
-        board_id = board_id or self.ticket_defaults.board_id
-        priority_id = priority_id or self.ticket_defaults.priority_id
-        status_id = status_id or self.ticket_defaults.status_id
-        type_id = type_id or self.ticket_defaults.type_id
-        source_id = source_id or self.ticket_defaults.source_id
+        defaults = self.ticket_defaults
+        company_id = company_id or defaults.company_id
+        board_id = board_id or defaults.board_id
+        priority_id = priority_id or defaults.priority_id
+        status_id = status_id or defaults.status_id
+        type_id = type_id or defaults.type_id
+        source_id = source_id or defaults.source_id
 
         payload = {
             "summary": summary,
             "board": {"id": board_id},
             "company": {"id": company_id},
             "priority": {"id": priority_id},
-            "type": {"id": type_id} if type_id else None,
-            "status": {"id": status_id} if status_id else None,
-            "source": {"id": source_id} if source_id else None,
             "initialDescription": body
         }
+        # Optional references are left out entirely rather than sent as null
+        for key, record_id in (("type", type_id), ("status", status_id), ("source", source_id)):
+            if record_id:
+                payload[key] = {"id": record_id}
 
         # Create the ticket
         ticket_data = self.post("service/tickets", payload)
@@ -66,9 +74,9 @@ class TicketMixin:
 
         ticket_id = ticket_data.get("id")
 
-        # Attach configurations (if any)
-        for config_id in config_ids:
-            self.attach_configuration(ticket_id, config_id)
+        # Attach configurations (if any), concurrently
+        if config_ids:
+            self.attach_configurations(ticket_id, config_ids)
 
         return Ticket.from_dict(ticket_data)
     
@@ -76,21 +84,34 @@ class TicketMixin:
         """
         Get a specific ticket by ID.
 
+        Tickets are cached per ID for _TICKET_CACHE_TTL seconds, and callers share
+        the cached instance: Tickets are frozen, and their nested reference dicts
+        are to be treated as read-only (use dataclasses.replace() for a modified
+        copy). Any write through this client under service/tickets/{id} drops that
+        ticket from the cache.
+
         Args:
             ticket_id: Ticket ID to retrieve
 
         Returns:
             Optional[Ticket]: Ticket details, or None if not found
         """
-        result = self.get(f"service/tickets/{ticket_id}")
-        return Ticket.from_dict(result) if result else None
+        ticket = self._ticket_cache.get(ticket_id)
+        if ticket is None:
+            result = self.get(f"service/tickets/{ticket_id}")
+            if not result:
+                return None
+            ticket = Ticket.from_dict(result)
+            self._ticket_cache.set(ticket_id, ticket)
+        return ticket
     
     def get_tickets(
         self,
         conditions: str = "",
         pagesize: int = 1000,
         orderby: str = "",
-        limit: int = None
+        limit: int = None,
+        include_notes: bool = False
     ) -> List[Ticket]:
         """
         Get multiple tickets with optional filtering.
@@ -101,6 +122,8 @@ class TicketMixin:
             orderby: Order by clause
             limit: Cap the number of results returned. If set, makes a single
                    page request instead of paginating through all records.
+            include_notes: If True, also fetch each ticket's notes (concurrently,
+                           see get_notes_for_tickets) into Ticket.notes
 
         Returns:
             List[Ticket]: List of tickets
@@ -110,11 +133,81 @@ class TicketMixin:
                                orderby=orderby, pagesize=limit) or []
             if not isinstance(results, list):
                 results = [results]
+            tickets = [Ticket.from_dict(ticket) for ticket in results]
         else:
-            results = self.get_all("service/tickets", conditions=conditions,
-                                   pagesize=pagesize, orderby=orderby)
-        return [Ticket.from_dict(ticket) for ticket in results]
+            tickets = list(self.iter_tickets(conditions=conditions, pagesize=pagesize,
+                                             orderby=orderby))
+        if include_notes and tickets:
+            notes = self.get_notes_for_tickets([ticket.id for ticket in tickets])
+            tickets = [replace(ticket, notes=notes[ticket.id]) for ticket in tickets]
+        return tickets
     
+    def iter_tickets(
+        self,
+        conditions: str = "",
+        pagesize: int = 1000,
+        orderby: str = ""
+    ) -> Iterator[Ticket]:
+        """
+        Lazily iterate over tickets with optional filtering.
+
+        Tickets are built from each page as soon as it arrives, while later pages
+        are still being fetched.
+
+        Args:
+            conditions: ConnectWise conditions string for filtering
+            pagesize: Results per page
+            orderby: Order by clause
+
+        Yields:
+            Ticket: Each matching ticket
+        """
+        results = self.iter_all("service/tickets", conditions=conditions,
+                                pagesize=pagesize, orderby=orderby)
+        return (Ticket.from_dict(ticket) for ticket in results)
+
+    def get_tickets_by_ids(self, ticket_ids: List[int]) -> List[Ticket]:
+        """
+        Get many tickets by ID using "id in (...)" queries instead of one request per ticket.
+
+        Tickets already in the get_ticket cache are served from it; the rest are
+        queried in batches of _ID_BATCH_SIZE, with batches fetched concurrently,
+        and added to the cache.
+
+        Args:
+            ticket_ids: Ticket IDs to retrieve
+
+        Returns:
+            List[Ticket]: Tickets in the order requested; IDs that were not found
+                          are omitted
+        """
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+        found = {}
+        missing = []
+        for ticket_id in ticket_ids:
+            ticket = self._ticket_cache.get(ticket_id)
+            if ticket is None:
+                missing.append(ticket_id)
+            else:
+                found[ticket_id] = ticket
+
+        batches = [missing[i:i + _ID_BATCH_SIZE]
+                   for i in range(0, len(missing), _ID_BATCH_SIZE)]
+        pages = self._map_concurrent(
+            lambda batch: self.get_all(
+                "service/tickets",
+                conditions="id in (" + ",".join(map(str, batch)) + ")",
+                pagesize=1000
+            ),
+            batches
+        )
+        for page in pages:
+            for data in page:
+                ticket = Ticket.from_dict(data)
+                self._ticket_cache.set(ticket.id, ticket)
+                found[ticket.id] = ticket
+        return [found[ticket_id] for ticket_id in ticket_ids if ticket_id in found]
+
     def get_ticket_count(self, conditions: str = "") -> Optional[int]:
         """
         Return the total number of tickets matching the given conditions
@@ -139,16 +232,7 @@ class TicketMixin:
         Returns:
             Optional[Ticket]: Updated ticket, or None if not found
         """
-        operations = [
-            {
-                "op": "replace",
-                "path": "/status",
-                "value": {"id": status_id}
-            }
-        ]
-
-        result = self.patch("service/tickets", ticket_id, operations)
-        return Ticket.from_dict(result) if result else None
+        return self.update_ticket_fields(ticket_id, status_id=status_id)
     
     def update_ticket_priority(self, ticket_id: int, priority_id: int) -> Optional[Ticket]:
         """
@@ -161,16 +245,7 @@ class TicketMixin:
         Returns:
             Optional[Ticket]: Updated ticket, or None if not found
         """
-        operations = [
-            {
-                "op": "replace",
-                "path": "/priority",
-                "value": {"id": priority_id}
-            }
-        ]
-
-        result = self.patch("service/tickets", ticket_id, operations)
-        return Ticket.from_dict(result) if result else None
+        return self.update_ticket_fields(ticket_id, priority_id=priority_id)
     
     def update_ticket_company(self, ticket_id: int, company_id: int) -> Optional[Ticket]:
         """
@@ -183,16 +258,7 @@ class TicketMixin:
         Returns:
             Optional[Ticket]: Updated ticket, or None if not found
         """
-        operations = [
-            {
-                "op": "replace",
-                "path": "/company",
-                "value": {"id": company_id}
-            }
-        ]
-
-        result = self.patch("service/tickets", ticket_id, operations)
-        return Ticket.from_dict(result) if result else None
+        return self.update_ticket_fields(ticket_id, company_id=company_id)
     
     def update_ticket_field(self, ticket_id: int, field_path: str,
                            value: any) -> Optional[Ticket]:
@@ -207,13 +273,47 @@ class TicketMixin:
         Returns:
             Optional[Ticket]: Updated ticket, or None if not found
         """
+        return self.update_ticket_fields(ticket_id, fields={field_path: value})
+
+    def update_ticket_fields(
+        self,
+        ticket_id: int,
+        *,
+        status_id: int = None,
+        priority_id: int = None,
+        company_id: int = None,
+        fields: Dict[str, Any] = None
+    ) -> Optional[Ticket]:
+        """
+        Update several ticket fields with a single PATCH request.
+
+        Args:
+            ticket_id: The ID of the ticket to update
+            status_id: Optional new status ID
+            priority_id: Optional new priority ID
+            company_id: Optional new company ID
+            fields: Optional mapping of field path (e.g., "/summary") to new value
+
+        Returns:
+            Optional[Ticket]: Updated ticket, or None if not found
+
+        Raises:
+            ValueError: If no fields to update were given.
+        """
         operations = [
-            {
-                "op": "replace",
-                "path": field_path,
-                "value": value
-            }
+            {"op": "replace", "path": path, "value": {"id": record_id}}
+            for path, record_id in (("/status", status_id),
+                                    ("/priority", priority_id),
+                                    ("/company", company_id))
+            if record_id is not None
         ]
+        if fields:
+            operations.extend(
+                {"op": "replace", "path": path, "value": value}
+                for path, value in fields.items()
+            )
+        if not operations:
+            raise ValueError("update_ticket_fields requires at least one field to update")
 
         result = self.patch("service/tickets", ticket_id, operations)
         return Ticket.from_dict(result) if result else None
@@ -248,6 +348,39 @@ class TicketMixin:
             "child_ticket": child_ticket,
             "merge_response": merge_response
         }
+
+    def merge_tickets(self, child_ticket_ids: List[int], parent_ticket_id: int,
+                      child_status_id: int) -> dict:
+        """
+        Merge several child tickets into a parent ticket.
+
+        The child status updates are issued concurrently, then all children are
+        attached to the parent with a single attachChildren request.
+
+        Args:
+            child_ticket_ids: The ticket IDs of the child tickets
+            parent_ticket_id: The ticket ID of the parent ticket
+            child_status_id: The status ID to assign to each child ticket
+
+        Returns:
+            dict: A dict containing the results of both operations
+                  {"child_tickets": List[Ticket], "merge_response": dict}
+        """
+        # Step 1: Update child ticket statuses
+        child_tickets = self._map_concurrent(
+            lambda ticket_id: self.update_ticket_status(ticket_id, child_status_id),
+            child_ticket_ids
+        )
+
+        # Step 2: Attach all children to the parent in one request
+        merge_endpoint = f"service/tickets/{parent_ticket_id}/attachChildren"
+        data = {"childTicketIds": list(child_ticket_ids)}
+        merge_response = self.post(merge_endpoint, data)
+
+        return {
+            "child_tickets": child_tickets,
+            "merge_response": merge_response
+        }
     
     def add_ticket_note(self, ticket_id: int, note_text: str,
                        internal: bool = True) -> Note:
@@ -294,7 +427,7 @@ class TicketMixin:
         Returns:
             List[Note]: List of notes
         """
-        results = self.get_all(
+        results = self.iter_all(
             f"service/tickets/{ticket_id}/notes",
             conditions=conditions,
             childconditions=childconditions,
@@ -302,4 +435,34 @@ class TicketMixin:
             pagesize=pagesize,
             orderby=orderby
         )
-        return [Note.from_dict(note) for note in results]
\ No newline at end of file
+        return [Note.from_dict(note) for note in results]
+
+    def get_notes_for_tickets(
+        self,
+        ticket_ids: List[int],
+        conditions: str = "",
+        fields: str = "",
+        orderby: str = ""
+    ) -> Dict[int, List[Note]]:
+        """
+        Get the notes for several tickets, fetching each ticket's notes concurrently.
+
+        Avoids the N+1 pattern of calling get_ticket_notes once per ticket in a loop.
+
+        Args:
+            ticket_ids: Ticket IDs
+            conditions: Optional conditions string for filtering notes
+            fields: Optional comma-separated fields to include in the response
+            orderby: Optional order by clause
+
+        Returns:
+            Dict[int, List[Note]]: Notes keyed by ticket ID, in the order given
+        """
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+        notes = self._map_concurrent(
+            lambda ticket_id: self.get_ticket_notes(
+                ticket_id, conditions=conditions, fields=fields, orderby=orderby
+            ),
+            ticket_ids
+        )
+        return dict(zip(ticket_ids, notes))
@@ -1,9 +1,10 @@
 from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional
-from connectwise.utils import parse_cw_datetime
+from typing import Dict, Optional
+from connectwise.utils import add_slots, compile_from_dict, parse_cw_datetime
 
 
+@add_slots
 @dataclass
 class Configuration:
     """Represents a ConnectWise configuration (device/asset)."""
@@ -62,6 +63,15 @@ class Configuration:
     showAutomateFlag: Optional[bool] = None
     needsRenewalFlag: Optional[bool] = None
 
+    # Projections for the 'fields' parameter of get_configurations: listings
+    # rarely need more than these columns, and the response is a fraction of
+    # the size of full rows (class constants, not dataclass fields)
+    LIST_FIELDS = "id,name,company/id,company/name,type/id,type/name,status/id,status/name,activeFlag"
+    REPORT_FIELDS = (
+        LIST_FIELDS + ",serialNumber,modelNumber,tagNumber,ipAddress,macAddress,osType,"
+        "lastLoginName,installationDate,warrantyExpirationDate,manufacturer/name,vendor/name"
+    )
+
     @classmethod
     def from_dict(cls, data: dict) -> 'Configuration':
         """
@@ -74,26 +84,7 @@ class Configuration:
         Returns:
             Configuration: Configuration object
         """
-        # Extract only fields that exist in the dataclass
-        valid_fields = {field for field in cls.__dataclass_fields__.keys()}
-        filtered_data = {
-            key: value for key, value in data.items()
-            if key in valid_fields
-        }
-
-        # Set required fields with defaults if missing (for partial data)
-        if 'id' not in filtered_data:
-            filtered_data['id'] = data.get('id', 0)
-        if 'name' not in filtered_data:
-            filtered_data['name'] = data.get('name', '')
-        if 'company' not in filtered_data:
-            filtered_data['company'] = data.get('company', {})
-        if 'type' not in filtered_data:
-            filtered_data['type'] = data.get('type', {})
-        if 'status' not in filtered_data:
-            filtered_data['status'] = data.get('status', {})
-
-        return cls(**filtered_data)
+        return _from_dict(cls, data)
 
     def to_dict(self, exclude_none: bool = True, exclude_id: bool = False) -> dict:
         """
@@ -107,13 +98,13 @@ class Configuration:
             dict: API-compatible dictionary representation.
         """
         result = {}
-        for f in fields(self):
-            value = getattr(self, f.name)
-            if exclude_id and f.name == "id":
+        for name in _FIELD_NAMES:
+            if exclude_id and name == "id":
                 continue
+            value = getattr(self, name)
             if exclude_none and value is None:
                 continue
-            result[f.name] = value
+            result[name] = value
         return result
 
     def set_question(self, question_id: int, answer: str):
@@ -151,35 +142,78 @@ class Configuration:
             f"Available questions: {available}"
         )
 
+    @staticmethod
+    def build_question_index(question_definitions: list) -> Dict[str, int]:
+        """
+        Build a lookup of lower-cased question label to question ID.
+
+        Build it once per configuration type and pass it to
+        set_question_by_name_indexed when setting answers on many configurations.
+
+        Args:
+            question_definitions: List of question definition dicts from
+                                  get_configuration_type_questions().
+
+        Returns:
+            Dict[str, int]: Question ID keyed by lower-cased label. If labels
+                            repeat, the first definition wins, as in
+                            set_question_by_name.
+        """
+        index = {}
+        for qdef in question_definitions:
+            index.setdefault(qdef.get("question", "").lower(),
+                             qdef.get("questionId") or qdef.get("id"))
+        return index
+
+    def set_question_by_name_indexed(self, name: str, answer: str, index: Dict[str, int]):
+        """
+        Set or update a custom question answer using a prebuilt question index.
+
+        Args:
+            name: The question label to match (case-insensitive).
+            answer: The answer value to set.
+            index: Mapping from build_question_index().
+
+        Raises:
+            ValueError: If no question matches the given name.
+        """
+        key = name.lower()
+        if key not in index:
+            raise ValueError(
+                f"No question matching '{name}'. "
+                f"Available questions: {list(index)}"
+            )
+        self.set_question(index[key], answer)
+
     @property
     def company_name(self) -> str:
         """Get company name from nested dict."""
-        return self.company.get("name", "") if self.company else ""
+        return company.get("name", "") if (company := self.company) else ""
 
     @property
     def company_id(self) -> Optional[int]:
         """Get company ID from nested dict."""
-        return self.company.get("id") if self.company else None
+        return company.get("id") if (company := self.company) else None
 
     @property
     def type_name(self) -> str:
         """Get type name from nested dict."""
-        return self.type.get("name", "") if self.type else ""
+        return config_type.get("name", "") if (config_type := self.type) else ""
 
     @property
     def status_name(self) -> str:
         """Get status name from nested dict."""
-        return self.status.get("name", "") if self.status else ""
+        return status.get("name", "") if (status := self.status) else ""
 
     @property
     def vendor_name(self) -> Optional[str]:
         """Get vendor name from nested dict."""
-        return self.vendor.get("name") if self.vendor else None
+        return vendor.get("name") if (vendor := self.vendor) else None
 
     @property
     def manufacturer_name(self) -> Optional[str]:
         """Get manufacturer name from nested dict."""
-        return self.manufacturer.get("name") if self.manufacturer else None
+        return manufacturer.get("name") if (manufacturer := self.manufacturer) else None
 
     @property
     def is_active(self) -> bool:
@@ -205,3 +239,11 @@ class Configuration:
     def __str__(self) -> str:
         """String representation showing key configuration details."""
         return f"#{self.id} - {self.name} [{self.status_name}]"
+
+
+# Field names in declaration order, for to_dict
+_FIELD_NAMES = tuple(f.name for f in fields(Configuration))
+
+# Specialized from_dict body, generated once from the field list. Required fields
+# get empty defaults when missing (for partial data via the 'fields' parameter)
+_from_dict = compile_from_dict(Configuration, required={'id': int, 'name': str, 'company': dict, 'type': dict, 'status': dict})
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
-from connectwise.utils import parse_cw_datetime
+from connectwise.utils import add_slots, compile_from_dict, parse_cw_datetime
 
 
+@add_slots
 @dataclass
 class Note:
     """Represents a ConnectWise ticket note."""
@@ -34,22 +35,7 @@ class Note:
         Returns:
             Note: Note object
         """
-        # Extract only fields that exist in the dataclass
-        valid_fields = {field for field in cls.__dataclass_fields__.keys()}
-        filtered_data = {
-            key: value for key, value in data.items()
-            if key in valid_fields
-        }
-
-        # Set required fields with defaults if missing (for partial data)
-        if 'id' not in filtered_data:
-            filtered_data['id'] = data.get('id', 0)
-        if 'ticketId' not in filtered_data:
-            filtered_data['ticketId'] = data.get('ticketId', 0)
-        if 'text' not in filtered_data:
-            filtered_data['text'] = data.get('text', '')
-
-        return cls(**filtered_data)
+        return _from_dict(cls, data)
 
     @property
     def is_internal(self) -> bool:
@@ -90,3 +76,8 @@ class Note:
         note_type = "Internal" if self.is_internal else "External"
         preview = self.text[:50] + "..." if len(self.text) > 50 else self.text
         return f"Note #{self.id} [{note_type}]: {preview}"
+
+
+# Specialized from_dict body, generated once from the field list. Required fields
+# get empty defaults when missing (for partial data via the 'fields' parameter)
+_from_dict = compile_from_dict(Note, required={'id': int, 'ticketId': int, 'text': str})
@@ -1,12 +1,21 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
-from connectwise.utils import parse_cw_datetime
+from connectwise.utils import add_slots, compile_from_dict, parse_cw_datetime, slot_cached_property
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True, eq=False)
 class Ticket:
-    """Represents a ConnectWise ticket."""
+    """
+    Represents a ConnectWise ticket.
+
+    Tickets are immutable snapshots: use dataclasses.replace() to derive a
+    modified copy, and treat the nested reference dicts (board, company, ...)
+    as read-only, since values derived from them are computed once. Tickets
+    compare equal and hash by ticket ID, so they can be used directly in sets
+    and as dict keys.
+    """
     id: int
     summary: str
     board: dict
@@ -37,6 +46,9 @@ class Ticket:
     updatedBy: Optional[str] = None
     dateEntered: Optional[str] = None
 
+    # Populated client-side by get_tickets(include_notes=True); not an API field
+    notes: Optional[list] = None
+
     @classmethod
     def from_dict(cls, data: dict) -> 'Ticket':
         """
@@ -48,87 +60,94 @@ class Ticket:
         Returns:
             Ticket: Ticket object
         """
-        # Extract only fields that exist in the dataclass
-        valid_fields = {
-            field for field in cls.__dataclass_fields__.keys()
-        }
-        filtered_data = {
-            key: value for key, value in data.items()
-            if key in valid_fields
-        }
-        # Pull _info fields into top-level
-        info = data.get("_info", {})
-        for field in ("lastUpdated", "updatedBy", "dateEntered"):
-            if field in info:
-                filtered_data[field] = info[field]
-        return cls(**filtered_data)
+        return _from_dict(cls, data)
     
-    @property
+    @slot_cached_property
     def board_name(self) -> str:
         """Get board name from nested dict."""
-        return self.board.get("name", "") if self.board else ""
+        return self.board.get("name") or ""
     
-    @property
+    @slot_cached_property
     def company_name(self) -> str:
         """Get company name from nested dict."""
-        return self.company.get("name", "") if self.company else ""
+        return self.company.get("name") or ""
     
-    @property
+    @slot_cached_property
     def company_id(self) -> Optional[int]:
         """Get company ID from nested dict."""
-        return self.company.get("id") if self.company else None
+        return self.company.get("id")
     
-    @property
+    @slot_cached_property
     def priority_name(self) -> str:
         """Get priority name from nested dict."""
-        return self.priority.get("name", "") if self.priority else ""
+        return self.priority.get("name") or ""
     
-    @property
+    @slot_cached_property
     def status_name(self) -> str:
         """Get status name from nested dict."""
-        return self.status.get("name", "") if self.status else ""
+        return self.status.get("name") or ""
     
-    @property
+    @slot_cached_property
     def type_name(self) -> Optional[str]:
         """Get type name from nested dict."""
-        return self.type.get("name") if self.type else None
+        return ticket_type.get("name") if (ticket_type := self.type) else None
     
-    @property
+    @slot_cached_property
     def source_name(self) -> Optional[str]:
         """Get source name from nested dict."""
-        return self.source.get("name") if self.source else None
+        return source.get("name") if (source := self.source) else None
     
-    @property
+    @slot_cached_property
     def owner_name(self) -> Optional[str]:
         """Get owner name from nested dict."""
-        return self.owner.get("name") if self.owner else None
+        return owner.get("name") if (owner := self.owner) else None
     
-    @property
+    @slot_cached_property
     def contact_name(self) -> Optional[str]:
         """Get contact name from nested dict."""
-        return self.contact.get("name") if self.contact else None
+        return contact.get("name") if (contact := self.contact) else None
     
     @property
     def is_closed(self) -> bool:
         """Check if ticket is closed."""
         return self.closedFlag
     
-    @property
+    @slot_cached_property
     def closed_datetime(self) -> Optional[datetime]:
         return parse_cw_datetime(self.closedDate)
 
-    @property
+    @slot_cached_property
     def required_datetime(self) -> Optional[datetime]:
         return parse_cw_datetime(self.requiredDate)
 
-    @property
+    @slot_cached_property
     def last_updated_datetime(self) -> Optional[datetime]:
         return parse_cw_datetime(self.lastUpdated)
 
-    @property
+    @slot_cached_property
     def date_entered_datetime(self) -> Optional[datetime]:
         return parse_cw_datetime(self.dateEntered)
     
+    def __eq__(self, other) -> bool:
+        """Tickets are equal when they have the same ID."""
+        if other.__class__ is self.__class__:
+            return self.id == other.id
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash by ticket ID."""
+        return hash(self.id)
+
     def __str__(self) -> str:
         """String representation showing key ticket details."""
-        return f"#{self.id} - {self.summary} [{self.status_name}]"
\ No newline at end of file
+        return f"#{self.id} - {self.summary} [{self.status_name}]"
+
+
+# Specialized from_dict body, generated once from the field list. The audit
+# fields live under the record's _info metadata and are pulled to the top level;
+# the required references are never None, so their properties need no guard
+_from_dict = compile_from_dict(
+    Ticket,
+    required={'board': dict, 'company': dict, 'priority': dict, 'status': dict},
+    info_fields=("lastUpdated", "updatedBy", "dateEntered")
+)
@@ -1,7 +1,232 @@
 """Utility classes and functions for ConnectWise integration."""
 
+import dataclasses
+import functools
+import hmac
+import inspect
+import json
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import (
+    Any, Callable, Dict, Generic, Hashable, Iterable, Optional, Type, TypeVar, cast, overload
+)
+
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+T = TypeVar('T')
+
+
+def json_loads(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize a JSON request body to compact UTF-8 bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+class slot_cached_property(Generic[T]):
+    """
+    Read-only property computed on first access and memoized in a private slot.
+
+    Only valid on classes decorated with :func:`add_slots`, which reserves a
+    ``_<name>`` slot for each of these and swaps in a generated getter that
+    reads the slot directly (as fast as a hand-written memoizing property).
+    The value is stored with ``object.__setattr__``, so it also works on
+    frozen dataclasses.
+    """
+
+    def __init__(self, func: Callable[[Any], T]):
+        self.func = func
+        self.slot_name = f"_{func.__name__}"
+
+    @overload
+    def __get__(self, obj: None, objtype: Optional[type] = None) -> 'slot_cached_property[T]': ...
+
+    @overload
+    def __get__(self, obj: object, objtype: Optional[type] = None) -> T: ...
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        raise TypeError(f"{self.func.__qualname__} requires a class decorated with add_slots")
+
+    def build(self) -> property:
+        """Generate the memoizing property that add_slots installs on the class."""
+        namespace: Dict[str, Any] = {'_func': self.func, '_setattr': object.__setattr__}
+        exec(
+            f"def {self.func.__name__}(self):\n"
+            f"    try:\n"
+            f"        return self.{self.slot_name}\n"
+            f"    except AttributeError:  # first access\n"
+            f"        value = _func(self)\n"
+            f"        _setattr(self, {self.slot_name!r}, value)\n"
+            f"        return value\n",
+            namespace
+        )
+        getter = namespace[self.func.__name__]
+        getter.__qualname__ = self.func.__qualname__
+        return property(getter, doc=self.func.__doc__)
+
+
+def add_slots(cls: Optional[type] = None, *, extra_slots: Iterable[str] = ()):
+    """
+    Give a dataclass ``__slots__`` for its fields.
+
+    Backport of ``@dataclass(slots=True)`` (Python 3.10+): the class is rebuilt
+    without a per-instance ``__dict__``, which shrinks instances and speeds up
+    attribute access. Apply it above ``@dataclass``, either bare or as
+    ``@add_slots(extra_slots=(...))`` to reserve slots for private,
+    non-field attributes (these start out unset). Each
+    :class:`slot_cached_property` on the class gets its slot automatically.
+    """
+    def wrap(cls: type) -> type:
+        if '__slots__' in cls.__dict__:
+            raise TypeError(f"{cls.__name__} already specifies __slots__")
+        field_names = tuple(f.name for f in dataclasses.fields(cls))
+        cached = {name: attr for name, attr in cls.__dict__.items()
+                  if isinstance(attr, slot_cached_property)}
+        cls_dict = dict(cls.__dict__)
+        cls_dict['__slots__'] = (
+            field_names + tuple(extra_slots) + tuple(prop.slot_name for prop in cached.values())
+        )
+        for name, prop in cached.items():
+            cls_dict[name] = prop.build()
+        # Field defaults live on the class and would clash with the slot descriptors;
+        # the generated __init__ already carries them.
+        for name in field_names:
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        if getattr(cls, '__dataclass_params__').frozen:
+            # Pickle/copy restore slots with setattr, which a frozen class rejects
+            def __getstate__(self):
+                return [getattr(self, name) for name in field_names]
+
+            def __setstate__(self, state):
+                for name, value in zip(field_names, state):
+                    object.__setattr__(self, name, value)
+
+            cls_dict['__getstate__'] = __getstate__
+            cls_dict['__setstate__'] = __setstate__
+        slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+
+    return wrap if cls is None else wrap(cls)
+
+
+def compile_from_dict(
+    cls: Type[T],
+    required: Optional[Dict[str, Callable[[], Any]]] = None,
+    info_fields: Iterable[str] = ()
+) -> Callable[[Type[T], dict], T]:
+    """
+    Generate a specialized ``from_dict(cls, data)`` function for a dataclass.
+
+    The generated function reads each field straight from ``data`` instead of
+    filtering keys into a new dict and unpacking it as keyword arguments on
+    every row. Keys that are not fields are ignored; missing fields fall back
+    to the dataclass defaults.
+
+    For slotted classes (see :func:`add_slots`) without ``__post_init__`` or
+    ``init=False`` fields, the instance is created with ``cls.__new__`` and each value is written through
+    its slot descriptor, skipping the dataclass ``__init__`` (which for frozen
+    classes goes through ``object.__setattr__`` per field). Other classes are
+    built by calling the constructor positionally.
+
+    Args:
+        cls: The dataclass to build instances of.
+        required: Factories for fields without a dataclass default, called when
+                  the field is missing or null (e.g. ``{'id': int, 'company': dict}``),
+                  so these fields are never None. A missing required field
+                  without a factory raises TypeError, as the constructor would.
+        info_fields: Fields read from the record's ``_info`` metadata dict when
+                     present there, taking precedence over top-level keys.
+
+    Returns:
+        Callable: ``from_dict(cls, data)``, to be called with the class itself
+                  (or a subclass) and an API dict. A subclass gets its own
+                  function, compiled on its first call, so its extra fields
+                  and ``__post_init__`` are honored.
+    """
+    required = required or {}
+    info_fields = frozenset(info_fields)
+    subclass_cache: Dict[type, Callable] = {}
+
+    def for_subclass(subcls, data):
+        sub_from_dict = subclass_cache.get(subcls)
+        if sub_from_dict is None:
+            sub_from_dict = subclass_cache.setdefault(
+                subcls, compile_from_dict(subcls, required, info_fields)
+            )
+        return sub_from_dict(subcls, data)
+
+    def missing(name):
+        raise TypeError(f"{cls.__name__}.from_dict() missing required field: '{name}'")
+
+    all_fields = dataclasses.fields(cast(Any, cls))
+    fields = [f for f in all_fields if f.init]
+    # Slot descriptors are looked up along the MRO, so a slotted subclass of a
+    # slotted model also takes the direct path for its inherited fields.
+    slots = {f.name: inspect.getattr_static(cls, f.name, None) for f in fields}
+    # init=False fields are only set up by __init__, so their classes keep it
+    direct = (
+        not hasattr(cls, '__post_init__')
+        and len(fields) == len(all_fields)
+        and all(isinstance(slot, types.MemberDescriptorType) for slot in slots.values())
+    )
+    namespace: Dict[str, Any] = {'_missing': missing, '_cls': cls, '_for_subclass': for_subclass}
+    args = []
+    for i, f in enumerate(fields):
+        key = repr(f.name)
+        if f.default is not dataclasses.MISSING:
+            namespace[f'_default{i}'] = f.default
+            arg = f'get({key}, _default{i})'
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f'_factory{i}'] = f.default_factory
+            arg = f'data[{key}] if {key} in data else _factory{i}()'
+        elif f.name in required:
+            namespace[f'_factory{i}'] = required[f.name]
+            arg = f'get({key}) or _factory{i}()'
+        else:
+            arg = f'data[{key}] if {key} in data else _missing({key})'
+        if f.name in info_fields:
+            arg = f'info[{key}] if {key} in info else {arg}'
+        args.append(arg)
+    prelude = (
+        "    if cls is not _cls:\n"
+        "        return _for_subclass(cls, data)\n"
+        "    get = data.get\n"
+    )
+    if info_fields:
+        prelude += "    info = get('_info') or {}\n"
+    if direct:
+        namespace['_new'] = object.__new__
+        body = "    obj = _new(cls)\n"
+        for i, (f, arg) in enumerate(zip(fields, args)):
+            namespace[f'_set{i}'] = slots[f.name].__set__
+            body += f"    _set{i}(obj, {arg})\n"
+        body += "    return obj\n"
+    else:
+        body = "    return cls(\n        " + ",\n        ".join(args) + ",\n    )\n"
+    source = "def from_dict(cls, data):\n" + prelude + body
+    exec(source, namespace)
+    from_dict: Callable[[Type[T], dict], T] = namespace['from_dict']
+    from_dict.__qualname__ = f"{cls.__qualname__}.from_dict"
+    return from_dict
 
 
 def parse_cw_datetime(value: Optional[str]) -> Optional[datetime]:
@@ -9,11 +234,24 @@ def parse_cw_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
     try:
-        return datetime.fromisoformat(value.replace('Z', '+00:00'))
-    except (ValueError, AttributeError):
+        return _parse_iso(value)
+    except (ValueError, AttributeError, TypeError):
         return None
 
 
+# Timestamps repeat heavily across rows, and datetimes are immutable, so parsed
+# values are memoized and shared between callers
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing 'Z' ConnectWise uses natively
+    _parse_iso = functools.lru_cache(maxsize=8192)(datetime.fromisoformat)
+else:
+    @functools.lru_cache(maxsize=8192)
+    def _parse_iso(value: str) -> datetime:
+        if value[-1] == 'Z':
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
 class SecretString:
     """
     Wrapper for sensitive string values that prevents accidental exposure.
@@ -22,7 +260,7 @@ class SecretString:
     The real value must be explicitly retrieved via get_secret_value().
     """
 
-    __slots__ = ('_value',)
+    __slots__ = ('_value', '_hash', '_encoded')
 
     def __init__(self, value: str):
         """
@@ -32,6 +270,9 @@ class SecretString:
             value: The secret string to protect
         """
         self._value = value
+        self._hash = hash(value)
+        # compare_digest only accepts ASCII str, so compare the encoded form
+        self._encoded = value.encode('utf-8', 'surrogatepass')
 
     def get_secret_value(self) -> str:
         """
@@ -52,10 +293,81 @@ class SecretString:
 
     def __eq__(self, other) -> bool:
         """Allow equality comparison with other SecretString instances."""
-        if isinstance(other, SecretString):
-            return self._value == other._value
+        if other is self:
+            return True
+        if type(other) is SecretString:
+            # Constant-time, so comparisons don't leak how much of a secret matched
+            return hmac.compare_digest(self._encoded, other._encoded)
         return False
 
     def __hash__(self) -> int:
-        """Make SecretString hashable."""
-        return hash(self._value)
+        """Make SecretString hashable (computed once, at construction)."""
+        return self._hash
+
+    def __reduce__(self):
+        """Rebuild from the value when unpickled, since string hashes differ per process."""
+        return (SecretString, (self._value,))
+
+
+class TTLCache:
+    """
+    Small thread-safe mapping whose entries expire a fixed time after being set.
+
+    Once maxsize entries are held, the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 60):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Seconds an entry stays valid after being set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired or not), or default."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def remove_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,61 @@
+"""Shared fixtures: an in-memory fake of the requests session used by ConnectWiseClient."""
+
+import json
+
+import pytest
+
+from connectwise import ConnectWiseClient
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = b'' if body is None else json.dumps(body).encode()
+        self.text = self.content.decode()
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+
+class FakeSession:
+    """
+    Serves responses per (method, endpoint) and records every request.
+
+    A route is a FakeResponse, a callable taking the request kwargs, or a list of
+    responses served in turn (the last one repeats).
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self.headers = {}
+
+    def request(self, method, url, **kwargs):
+        endpoint = url.split('/apis/3.0/', 1)[1]
+        self.calls.append((method, endpoint, kwargs.get('params')))
+        route = self.routes.get((method, endpoint))
+        if isinstance(route, list):
+            route = route.pop(0) if len(route) > 1 else route[0]
+        return route(kwargs) if callable(route) else route or FakeResponse(404, {'message': 'nf'})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_client():
+    def make(routes, **kwargs):
+        client = ConnectWiseClient("https://cw.example.com", "co", "user", "pass", "cid", **kwargs)
+        client._session = FakeSession(routes)
+        return client
+    return make
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr('connectwise.client.time.sleep', delays.append)
+    return delays
@@ -0,0 +1,206 @@
+"""Tests for ConnectWiseClient request handling."""
+
+import threading
+import time
+
+import pytest
+
+from conftest import FakeResponse
+from connectwise import ConnectWiseRateLimitError, ConnectWiseServerError
+
+
+def test_empty_get_page_is_end_of_data(make_client):
+    client = make_client({('GET', 'service/boards'): FakeResponse(200)})
+    assert client.get_all('service/boards') == []
+    assert client.get_boards() == []
+
+
+def test_empty_get_body_is_none(make_client):
+    client = make_client({('GET', 'service/tickets/1'): FakeResponse(200)})
+    assert client.get('service/tickets/1') is None
+
+
+def test_empty_write_body_is_empty_dict(make_client):
+    client = make_client({
+        ('POST', 'service/tickets'): FakeResponse(201),
+        ('PUT', 'service/tickets/1'): FakeResponse(200),
+        ('PATCH', 'service/tickets/1'): FakeResponse(200),
+    })
+    assert client.post('service/tickets', {'summary': 'x'}) == {}
+    assert client.put('service/tickets', 1, {'summary': 'x'}) == {}
+    assert client.patch('service/tickets', 1, []) == {}
+
+
+def test_ticket_writes_evict_cached_ticket(make_client):
+    ticket = {'id': 1, 'summary': 'Printer'}
+    client = make_client({
+        ('GET', 'service/tickets/1'): lambda kwargs: FakeResponse(200, ticket),
+        ('PATCH', 'service/tickets/1'): FakeResponse(200, {**ticket, 'summary': 'Scanner'}),
+        ('POST', 'service/tickets/1/notes'): FakeResponse(201, {'id': 9, 'ticketId': 1, 'text': 'x'}),
+    })
+    assert client.get_ticket(1).summary == 'Printer'
+    assert client._ticket_cache.get(1) is not None
+
+    ticket['summary'] = 'Scanner'
+    client.patch('service/tickets', 1, [{'op': 'replace', 'path': '/summary', 'value': 'Scanner'}])
+    assert client._ticket_cache.get(1) is None
+    assert client.get_ticket(1).summary == 'Scanner'
+
+    client.add_ticket_note(1, 'x')
+    assert client._ticket_cache.get(1) is None
+
+
+def test_read_during_ticket_write_is_not_left_cached(make_client):
+    def patch(kwargs):
+        # A concurrent reader caches the pre-write ticket while the PATCH is in flight
+        assert client.get_ticket(1).summary == 'Printer'
+        return FakeResponse(200, {'id': 1, 'summary': 'Scanner'})
+
+    client = make_client({
+        ('GET', 'service/tickets/1'): FakeResponse(200, {'id': 1, 'summary': 'Printer'}),
+        ('PATCH', 'service/tickets/1'): patch,
+    })
+    client.update_ticket_fields(1, fields={'/summary': 'Scanner'})
+    assert client._ticket_cache.get(1) is None
+
+
+def test_response_cache_off_by_default(make_client):
+    client = make_client({
+        ('GET', 'company/configurations/1'): FakeResponse(200, {'id': 1}, {'Cache-Control': 'max-age=60'}),
+    })
+    client.get('company/configurations/1')
+    client.get('company/configurations/1')
+    assert len(client._session.calls) == 2
+
+
+def test_response_cache_skips_pages(make_client):
+    headers = {'Cache-Control': 'max-age=60'}
+    client = make_client({
+        ('GET', 'company/configurations/1'): FakeResponse(200, {'id': 1}, headers),
+        ('GET', 'company/configurations'): FakeResponse(200, [{'id': 1}], headers),
+    }, response_cache_size=16)
+    assert client.get('company/configurations/1') == client.get('company/configurations/1')
+    assert len(client._session.calls) == 1
+
+    client.get_all('company/configurations')
+    client.get_all('company/configurations')
+    assert len(client._session.calls) == 3
+    assert len(client._response_cache) == 1
+
+
+def test_rate_limited_request_is_retried(make_client, sleeps):
+    client = make_client({('GET', 'service/tickets/1'): [
+        FakeResponse(429, {'message': 'slow down'}, {'Retry-After': '2'}),
+        FakeResponse(200, {'id': 1}),
+    ]})
+    assert client.get('service/tickets/1') == {'id': 1}
+    assert sleeps == [2.0]
+
+
+def test_post_is_not_retried_on_server_error(make_client, sleeps):
+    client = make_client({('POST', 'service/tickets'): [
+        FakeResponse(503, {'message': 'down'}),
+        FakeResponse(201, {'id': 1}),
+    ]})
+    with pytest.raises(ConnectWiseServerError):
+        client.post('service/tickets', {'summary': 'x'})
+    assert len(client._session.calls) == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('Wed, 21 Oct 2026 07:28:00 GMT', None),
+    ('-1', 0),
+    ('86400', 60),
+])
+def test_malformed_retry_after(make_client, sleeps, header, expected):
+    client = make_client({('GET', 'service/tickets/1'): FakeResponse(429, {'message': 'slow down'},
+                                                                    {'Retry-After': header})},
+                         max_retries=1)
+    with pytest.raises(ConnectWiseRateLimitError) as excinfo:
+        client.get('service/tickets/1')
+    assert excinfo.value.retry_after == expected
+    assert len(sleeps) == 1 and 0 <= sleeps[0] <= 60
+
+
+def paged(records, count=True):
+    """Routes serving records in pages, with or without a /count endpoint."""
+    def page(kwargs):
+        size, number = kwargs['params']['pagesize'], kwargs['params']['page']
+        return FakeResponse(200, records[(number - 1) * size:number * size])
+
+    routes = {('GET', 'service/tickets'): page}
+    if count:
+        routes[('GET', 'service/tickets/count')] = FakeResponse(200, {'count': len(records)})
+    return routes
+
+
+def requested_pages(client):
+    return [params['page'] for method, endpoint, params in client._session.calls
+            if endpoint == 'service/tickets']
+
+
+def test_short_first_page_is_one_request(make_client):
+    client = make_client(paged([{'id': i} for i in range(3)]))
+    assert client.get_all('service/tickets', pagesize=5) == [{'id': i} for i in range(3)]
+    assert [endpoint for _, endpoint, _ in client._session.calls] == ['service/tickets']
+
+
+def test_full_first_page_reads_count_and_keeps_order(make_client):
+    records = [{'id': i} for i in range(23)]
+    client = make_client(paged(records), max_concurrency=3)
+    assert client.get_all('service/tickets', pagesize=5) == records
+    endpoints = [endpoint for _, endpoint, _ in client._session.calls]
+    assert endpoints.count('service/tickets/count') == 1
+    assert sorted(requested_pages(client)) == [1, 2, 3, 4, 5]
+
+
+def test_count_404_falls_back_to_doubling_batches(make_client):
+    records = [{'id': i} for i in range(32)]
+    client = make_client(paged(records, count=False), max_concurrency=4)
+    assert client.get_all('service/tickets', pagesize=5) == records
+    # page 1, then batches of 2 and 4: the short page 7 ends the data
+    assert sorted(requested_pages(client)) == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_iter_all_stops_requesting_when_abandoned(make_client):
+    records = [{'id': i} for i in range(100)]
+    client = make_client(paged(records), max_concurrency=2)
+    for record in client.iter_all('service/tickets', pagesize=5):
+        if record['id'] == 12:
+            break
+    # page 1, then a sliding window of two pages ahead of the consumer (not all 20)
+    assert sorted(requested_pages(client)) == [1, 2, 3, 4, 5]
+
+
+def test_get_ticket_shares_cached_instance(make_client):
+    client = make_client({('GET', 'service/tickets/1'): FakeResponse(200, {'id': 1, 'summary': 'Printer'})})
+    assert client.get_ticket(1) is client.get_ticket(1)
+    assert client.get_tickets_by_ids([1]) == [client.get_ticket(1)]
+    assert len(client._session.calls) == 1
+
+
+def test_notes_for_many_tickets_stay_within_max_concurrency(make_client):
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, peak
+
+    def notes(kwargs):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight[0] -= 1
+        size, number = kwargs['params']['pagesize'], kwargs['params']['page']
+        rows = [{'id': i, 'ticketId': 1, 'text': 'x'} for i in range(2500)]
+        return FakeResponse(200, rows[(number - 1) * size:number * size])
+
+    routes = {}
+    for ticket_id in range(1, 5):
+        routes[('GET', f'service/tickets/{ticket_id}/notes')] = notes
+        routes[('GET', f'service/tickets/{ticket_id}/notes/count')] = FakeResponse(200, {'count': 2500})
+    client = make_client(routes, max_concurrency=3)
+
+    result = client.get_notes_for_tickets([1, 2, 3, 4])
+    assert [len(result[ticket_id]) for ticket_id in range(1, 5)] == [2500] * 4
+    assert in_flight[1] <= 3
@@ -0,0 +1,14 @@
+"""Tests for ConfigurationMixin."""
+
+from conftest import FakeResponse
+
+
+def test_company_configurations_cached_for_str_and_int_ids(make_client):
+    def page(kwargs):
+        assert kwargs['params']['conditions'] == 'company/id=250'
+        return FakeResponse(200, [{'id': 1, 'name': 'PC-01', 'company': {'id': 250}}])
+
+    client = make_client({('GET', 'company/configurations'): page})
+    assert [c.name for c in client.get_company_configurations('250')] == ['PC-01']
+    assert [c.name for c in client.get_company_configurations(250)] == ['PC-01']
+    assert len(client._session.calls) == 1
@@ -0,0 +1,97 @@
+"""Tests for the generated from_dict constructors."""
+
+from dataclasses import dataclass, field, replace
+
+from connectwise.models.configuration import Configuration
+from connectwise.models.note import Note
+from connectwise.models.ticket import Ticket
+from connectwise.utils import add_slots, compile_from_dict
+
+
+CONFIG_DATA = {'id': 1, 'name': 'PC-01', 'company': {'id': 250}, 'serialNumber': 'SN1'}
+
+
+@dataclass
+class ExtendedConfiguration(Configuration):
+    extra: int = 0
+    tag: str = 'default'
+
+    def __post_init__(self):
+        self.extra = 99
+
+
+@add_slots
+@dataclass(frozen=True, eq=False)
+class ExtendedTicket(Ticket):
+    source: str = 'api'
+
+
+def test_configuration_from_dict():
+    config = Configuration.from_dict(CONFIG_DATA)
+    assert type(config) is Configuration
+    assert config.name == 'PC-01'
+    assert config.serialNumber == 'SN1'
+    assert config.type == {}
+    assert config.activeFlag is True
+
+
+def test_subclass_fields_and_post_init():
+    config = ExtendedConfiguration.from_dict({**CONFIG_DATA, 'tag': 'custom'})
+    assert type(config) is ExtendedConfiguration
+    assert config.extra == 99
+    assert config.tag == 'custom'
+    assert config.serialNumber == 'SN1'
+
+
+def test_base_class_unaffected_by_subclass():
+    ExtendedConfiguration.from_dict(CONFIG_DATA)
+    config = Configuration.from_dict({**CONFIG_DATA, 'tag': 'custom'})
+    assert type(config) is Configuration
+    assert not hasattr(config, 'tag')
+
+
+def test_slotted_subclass():
+    ticket = ExtendedTicket.from_dict({'id': 5, 'summary': 'Printer', 'source': 'email'})
+    assert type(ticket) is ExtendedTicket
+    assert ticket.source == 'email'
+    assert ticket.summary == 'Printer'
+    assert ticket.board == {}
+    assert ExtendedTicket.from_dict({'id': 6, 'summary': 'Fax'}).source == 'api'
+
+
+def test_ticket_info_fields():
+    ticket = Ticket.from_dict({
+        'id': 7,
+        'summary': 'VPN',
+        'board': None,
+        '_info': {'lastUpdated': '2024-01-02T03:04:05Z'},
+    })
+    assert ticket.board == {}
+    assert ticket.last_updated_datetime.year == 2024
+
+
+def test_note_required_defaults():
+    note = Note.from_dict({'text': 'Called user'})
+    assert note.id == 0
+    assert note.ticketId == 0
+    assert note.externalFlag is False
+
+
+def test_ticket_derived_names_follow_replace():
+    ticket = Ticket.from_dict({'id': 8, 'summary': 'Email', 'board': {'name': 'Help Desk'}})
+    assert ticket.board_name == 'Help Desk'
+    assert ticket.owner_name is None
+    moved = replace(ticket, board={'name': 'Projects'})
+    assert moved.board_name == 'Projects'
+    assert ticket.board_name == 'Help Desk'
+
+
+def test_slotted_init_false_fields_get_defaults():
+    @add_slots
+    @dataclass
+    class Row:
+        x: int = 0
+        seen: list = field(init=False, default_factory=list)
+
+    row = compile_from_dict(Row)(Row, {'x': 1, 'seen': [1]})
+    assert (row.x, row.seen) == (1, [])